@@ -37,6 +37,7 @@ class ClientEvent(_ClientEvent):
         force_wrap: bool = None,
         force_ack: bool = None,
         additional_models: list[dict] = None,
+        trust_input: bool = None,
     ):
         super().__init__(
             model,
@@ -51,6 +52,7 @@ class ClientEvent(_ClientEvent):
             force_wrap is not False,
             force_ack is not False,
             additional_models,
+            trust_input,
         )
 
     def _force_wrap(self, data) -> dict:
@@ -1,24 +1,46 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Sequence
-from dataclasses import dataclass
-from functools import wraps
+from collections.abc import Callable
+from inspect import Parameter, signature
+from sys import intern
+from threading import Lock, Timer
 
+from flask import current_app, request
 from flask_socketio import emit
 from pydantic.v1 import BaseModel, ValidationError
 
 from .errors import EventException
-from ..utils import remove_none, render_model, render_packed, unpack_params
+from ..utils import compute_effective_fields, render_model, render_packed, unpack_params
+
+
+class _RenderOpts:  # built once per event instead of a kwargs dict per call
+    __slots__ = ("exclude_none", "effective_fields")
+
+    def __init__(
+        self,
+        model: type[BaseModel] | None,
+        exclude_none: bool,
+        include: set[str] = None,
+        exclude: set[str] = None,
+    ):
+        self.exclude_none = exclude_none
+        self.effective_fields = (
+            None
+            if model is None or (include is None and exclude is None)
+            else compute_effective_fields(model, include, exclude)
+        )
 
 
 class BaseEvent:  # do not instantiate!
+    __slots__ = ("name", "namespace")
+
     def __init__(
         self,
         name: str = None,
         namespace: str = None,
     ):
         self.name = None
-        self.namespace = namespace
+        self.namespace = intern(namespace) if namespace is not None else None
         if name is not None:
             self.attach_name(name)
 
@@ -33,6 +55,8 @@ class BaseEvent:  # do not instantiate!
 
 
 class Event(BaseEvent):  # do not instantiate!
+    __slots__ = ("model", "description", "_model_name", "_doc_cache")
+
     def __init__(
         self,
         model: type[BaseModel],
@@ -40,33 +64,54 @@ class Event(BaseEvent):  # do not instantiate!
         name: str = None,
         description: str = None,
     ):
+        self._doc_cache: dict[str | None, dict] = {}  # attach_name clears it
         super().__init__(name, namespace)
         self.model: type[BaseModel] = model
         self.description: str = description
+        self._model_name: str = getattr(model, "name", None) or model.__name__
 
     def attach_name(self, name: str):
-        self.name = name
+        # interned so that socketio's dispatch compares by pointer first
+        self.name = intern(name) if name is not None else None
+        self._doc_cache.clear()
 
     def attach_namespace(self, namespace: str):
-        self.namespace = namespace
+        self.namespace = intern(namespace) if namespace is not None else None
+        self._doc_cache.clear()
 
     def create_doc(self, namespace: str = None):
-        model_name: str = getattr(self.model, "name", None) or self.model.__name__
         if namespace is None:
             namespace = self.namespace
-        return remove_none(
-            {
-                "description": self.description,
-                "tags": [{"name": f"namespace-{namespace}"}]
-                if namespace is not None
-                else None,
-                "message": {"$ref": f"#/components/messages/{model_name}"},
-            }
-        )
+        cached = self._doc_cache.get(namespace)
+        if cached is None:
+            cached = {"message": {"$ref": f"#/components/messages/{self._model_name}"}}
+            if self.description is not None:
+                cached["description"] = self.description
+            if namespace is not None:
+                cached["tags"] = [{"name": f"namespace-{namespace}"}]
+            self._doc_cache[namespace] = cached
+        result = dict(cached)  # copied so that subclasses may modify their doc
+        result["message"] = dict(cached["message"])
+        tags = cached.get("tags")
+        if tags is not None:
+            result["tags"] = [dict(tag) for tag in tags]
+        return result
 
 
-@dataclass()
 class ClientEvent(Event):
+    __slots__ = (
+        "_ack_opts",
+        "handler",
+        "_original_function",
+        "ack_model",
+        "force_wrap",
+        "forced_ack",
+        "additional_models",
+        "trust_input",
+        "_field_names",
+        "_dispatch",
+    )
+
     def __init__(
         self,
         model: type[BaseModel],
@@ -81,21 +126,28 @@ class ClientEvent(Event):
         force_wrap: bool = None,
         force_ack: bool = None,
         additional_models: list[dict] = None,
+        trust_input: bool = None,
     ):
         super().__init__(model, namespace, name, description)
-        self._ack_kwargs = {
-            "exclude_none": exclude_none is not False,
-            "include": include,
-            "exclude": exclude,
-            "by_alias": True,
-        }
+        self._ack_opts = _RenderOpts(
+            ack_model, exclude_none is not False, include, exclude
+        )
         self.handler: Callable[[dict | None], dict] = handler
+        self._original_function: Callable | None = handler
         self.ack_model: type[BaseModel] = ack_model
         self.force_wrap: bool = force_wrap is True
         self.forced_ack: bool = force_ack is True and ack_model is None
         self.additional_models: list[dict] = additional_models or []
+        self.trust_input: bool = trust_input is True
+        self._field_names: frozenset[str] = frozenset(self.model.__fields__)
+        self._dispatch: Callable[[dict | None], dict] = self._dispatch_default
 
     def parse(self, data: dict):
+        # the fast path skips validation, use for pre-validated payloads only;
+        # anything that isn't a dict (None included) falls back to validating
+        if self.trust_input and isinstance(data, dict):
+            fields: dict = self.model.construct(**data).__dict__
+            return {name: fields.get(name) for name in self._field_names}
         return self.model.parse_obj(data).dict()
 
     def _force_wrap(self, result) -> dict:
@@ -104,10 +156,17 @@ class ClientEvent(Event):
     def _render_model(self, result) -> dict | str | int | None:
         if self.forced_ack:
             return result
-        return render_model(self.ack_model, result, **self._ack_kwargs)
+        opts = self._ack_opts
+        return render_model(
+            self.ack_model,
+            result,
+            opts.exclude_none,
+            by_alias=True,
+            effective_fields=opts.effective_fields,
+        )
 
     def _ack_response(self, result) -> dict:
-        if isinstance(result, Sequence) and not isinstance(result, str):
+        if type(result) is tuple:  # noqa: WPS516 (identity check, no ABC walk)
             result, code, message = unpack_params(result)
             return render_packed(self._render_model(result), code, message)
 
@@ -116,24 +175,64 @@ class ClientEvent(Event):
 
     def _handler(self, function: Callable[..., dict]):
         if self.forced_ack or self.ack_model is not None:
+            ack_response = self._ack_response  # bound once, not looked up per call
 
-            @wraps(function)
             def _handler_inner(*args, **kwargs):
-                return self._ack_response(function(*args, **kwargs))
+                return ack_response(function(*args, **kwargs))
 
+            _handler_inner.__name__ = function.__name__  # wraps() copies too much
             return _handler_inner
         return function
 
+    def _specialize(self, function: Callable) -> Callable[[dict | None], dict] | None:
+        try:  # not following __wrapped__: decorated handlers take **kwargs
+            parameters = signature(function, follow_wrapped=False).parameters
+        except (TypeError, ValueError):
+            return None
+        if any(
+            parameter.kind is not Parameter.POSITIONAL_OR_KEYWORD
+            for parameter in parameters.values()
+        ):
+            return None
+        if set(parameters) != set(self.model.__fields__):
+            return None
+        arguments = ", ".join(f"kwargs[{name!r}]" for name in parameters)
+        source = "\n".join(
+            (
+                "def specialized(data=None):",
+                "    try:",
+                "        kwargs = _event.parse(data)",
+                "    except _ValidationError as e:",
+                '        raise _EventException(400, "Validation failed", e.errors())',
+                f"    return _event.handler({arguments})",
+            )
+        )
+        scope = {
+            "_event": self,
+            "_ValidationError": ValidationError,
+            "_EventException": EventException,
+        }
+        exec(source, scope)  # noqa: S102 WPS421 (trusted, generated above)
+        return scope["specialized"]
+
     def bind(self, function):
+        """Attach the function to handle this event. A handler returning
+        code and/or message alongside its data must return a plain tuple;
+        any other result (lists included) is rendered as the ack data itself"""
+        self._original_function = function
         self.handler = self._handler(function)
+        self._dispatch = self._specialize(function) or self._dispatch_default
 
-    def __call__(self, data=None):
+    def _dispatch_default(self, data=None):
         try:
             kwargs = self.parse(data)
         except ValidationError as e:
             raise EventException(code=400, message="Validation failed", data=e.errors())
         return self.handler(**kwargs)
 
+    def __call__(self, data=None):
+        return self._dispatch(data)
+
     def attach_ack(
         self,
         ack_model: type[BaseModel],
@@ -142,21 +241,13 @@ class ClientEvent(Event):
         force_wrap: bool = None,
         exclude_none: bool = None,
     ) -> None:
-        self._ack_kwargs = {
-            "exclude_none": exclude_none is not False,
-            "include": include,
-            "exclude": exclude,
-            "by_alias": True,
-        }
+        self._ack_opts = _RenderOpts(
+            ack_model, exclude_none is not False, include, exclude
+        )
         self.ack_model: type[BaseModel] = ack_model
         self.force_wrap: bool = force_wrap is True
-        if self.handler is not None:
-
-            @wraps(self.handler)
-            def _handler(*args, **kwargs):
-                return self._ack_response(self.handler(*args, **kwargs))
-
-            self.handler = _handler
+        if self._original_function is not None:
+            self.handler = self._handler(self._original_function)
 
     def ack_model_doc(self):
         if self.forced_ack:
@@ -193,8 +284,15 @@ class ClientEvent(Event):
         return {"publish": result}
 
 
-@dataclass()
 class ServerEvent(Event):
+    __slots__ = (
+        "_emit_opts",
+        "_emit_buffer",
+        "_buffer_lock",
+        "_flush_timer",
+        "_flush_app",
+    )
+
     def __init__(
         self,
         model: type[BaseModel],
@@ -206,13 +304,15 @@ class ServerEvent(Event):
         exclude_none: bool = None,
     ):
         super().__init__(model, namespace, name, description)
-        self._emit_kwargs = {
-            "exclude_none": exclude_none is not False,
-            "include": include,
-            "exclude": exclude,
-            "by_alias": True,
-        }
-        self.model.Config.allow_population_by_field_name = True
+        self._emit_opts = _RenderOpts(
+            model, exclude_none is not False, include, exclude
+        )
+        if not getattr(self.model.Config, "allow_population_by_field_name", False):
+            self.model.Config.allow_population_by_field_name = True
+        self._emit_buffer: dict[tuple, list[dict]] = {}
+        self._buffer_lock: Lock = Lock()
+        self._flush_timer: Timer | None = None
+        self._flush_app = None
 
     def _emit(
         self,
@@ -221,12 +321,15 @@ class ServerEvent(Event):
         room: str = None,
         include_self: bool = True,
         broadcast: bool = False,
+        skip_sid: str = None,
+        _emit: Callable = emit,  # bound at definition time: LOAD_FAST per call
     ):
-        return emit(
+        return _emit(
             self.name,
             data,
             to=room,
             include_self=include_self,
+            skip_sid=skip_sid,
             namespace=namespace,
             broadcast=broadcast,
         )
@@ -240,22 +343,89 @@ class ServerEvent(Event):
         _namespace: str = None,
         **kwargs,
     ):
-        if _data is None:
-            _data: BaseModel = self.model(**kwargs)
+        if isinstance(_data, dict):  # trusted: caller is responsible for
+            payload = _data  # aliases and None stripping in dict payloads
+        else:
+            if _data is None:
+                _data: BaseModel = self.model(**kwargs)
+            opts = self._emit_opts
+            payload = render_model(
+                self.model,
+                _data,
+                opts.exclude_none,
+                by_alias=True,
+                effective_fields=opts.effective_fields,
+            )
         return self._emit(
-            render_model(self.model, _data, **self._emit_kwargs),
+            payload,
             _namespace,
             _room,
             _include_self,
             _broadcast,
         )
 
+    def emit_buffered(
+        self,
+        _room: str = None,
+        _include_self: bool = True,
+        _broadcast: bool = True,
+        _data: ... = None,
+        _namespace: str = None,
+        _flush_after: float = 0.005,
+        **kwargs,
+    ):
+        """Like :meth:`emit`, but collects messages with the same routing and
+        sends them as one list payload per flush period (clients must accept
+        batched arrays). Call :meth:`flush` on shutdown to drain the buffer"""
+        if _data is None:
+            _data: BaseModel = self.model(**kwargs)
+        opts = self._emit_opts
+        payload = render_model(
+            self.model,
+            _data,
+            opts.exclude_none,
+            by_alias=True,
+            effective_fields=opts.effective_fields,
+        )
+        # resolved now: the timer thread has no request to read the sid from
+        skip_sid = request.sid if not _include_self else None
+        with self._buffer_lock:
+            key = (_namespace, _room, skip_sid, _broadcast)
+            self._emit_buffer.setdefault(key, []).append(payload)
+            if self._flush_timer is None:
+                self._flush_app = current_app._get_current_object()  # noqa: WPS437
+                self._flush_timer = Timer(_flush_after, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _timed_flush(self):  # the timer thread has no app context of its own
+        with self._flush_app.app_context():
+            self.flush()
+
+    def flush(self):
+        with self._buffer_lock:
+            buffer = self._emit_buffer
+            self._emit_buffer = {}
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        for (namespace, room, skip_sid, broadcast), payloads in buffer.items():
+            self._emit(
+                payloads,
+                namespace,
+                room,
+                include_self=True,
+                broadcast=broadcast,
+                skip_sid=skip_sid,
+            )
+
     def create_doc(self, namespace: str = None):
         return {"subscribe": super().create_doc(namespace)}
 
 
-@dataclass()
 class DuplexEvent(BaseEvent):
+    __slots__ = ("client_event", "server_event", "description", "use_event")
+
     def __init__(
         self,
         client_event: ClientEvent = None,
@@ -290,6 +460,7 @@ class DuplexEvent(BaseEvent):
         ack_force_wrap: bool = None,
         ack_force: bool = None,
         additional_models: list[dict] = None,
+        trust_input: bool = None,
     ):
         return cls(
             ClientEvent(
@@ -305,6 +476,7 @@ class DuplexEvent(BaseEvent):
                 force_wrap=ack_force_wrap,
                 force_ack=ack_force,
                 additional_models=additional_models,
+                trust_input=trust_input,
             ),
             ServerEvent(
                 model=model,
@@ -322,14 +494,14 @@ class DuplexEvent(BaseEvent):
         )
 
     def attach_name(self, name: str):
-        self.name = name
-        self.client_event.name = name
-        self.server_event.name = name
+        self.name = intern(name) if name is not None else None
+        self.client_event.attach_name(self.name)
+        self.server_event.attach_name(self.name)
 
     def attach_namespace(self, namespace: str):
-        self.namespace = namespace
-        self.client_event.namespace = namespace
-        self.server_event.namespace = namespace
+        self.namespace = intern(namespace) if namespace is not None else None
+        self.client_event.attach_namespace(self.namespace)
+        self.server_event.attach_namespace(self.namespace)
 
     def emit(
         self,
@@ -352,10 +524,10 @@ class DuplexEvent(BaseEvent):
     def bind(self, function: Callable[..., dict]):
         if self.use_event:
 
-            @wraps(function)
             def duplex_handler(*args, **kwargs):
                 return function(*args, event=self, **kwargs)
 
+            duplex_handler.__name__ = function.__name__
             return self.client_event.bind(duplex_handler)
         return self.client_event.bind(function)
 
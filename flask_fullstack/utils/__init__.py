@@ -4,6 +4,6 @@ from .flask import unpack_params
 from .models import restx_model_to_message, restx_model_to_schema
 from .named import Nameable, NamedProperties, NamedPropertiesMeta
 from .other import NotImplementedField, TypeEnum, render_packed
-from .pydantic import kebabify_model, render_model
+from .pydantic import compute_effective_fields, kebabify_model, render_model
 from .pytest import check_code
 from .sqlalchemy import SQLAlchemy
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 from enum import Enum
 
-from .dicts import remove_none
-
 
 @property
 def NotImplementedField(_):  # noqa: N802 WPS614
@@ -66,4 +64,11 @@ def render_packed(
     code: int | None = None,
     message: str | None = None,
 ) -> dict:
-    return remove_none({"code": code, "message": message, "data": data})
+    result: dict = {}
+    if code is not None:
+        result["code"] = code
+    if message is not None:
+        result["message"] = message
+    if data is not None:
+        result["data"] = data
+    return result
@@ -3,10 +3,37 @@ from __future__ import annotations
 from pydantic.v1 import BaseModel
 
 
-def render_model(model: type[BaseModel], data, **kwargs) -> dict:
+def compute_effective_fields(
+    model: type[BaseModel],
+    include: set[str] = None,
+    exclude: set[str] = None,
+) -> frozenset[str]:
+    fields = model.__fields__
+    names = fields.keys() if include is None else include
+    return frozenset(
+        fields[name].alias if name in fields else name
+        for name in names
+        if exclude is None or name not in exclude
+    )
+
+
+def render_model(
+    model: type[BaseModel],
+    data,
+    exclude_none: bool = False,
+    include: set[str] = None,
+    exclude: set[str] = None,
+    by_alias: bool = False,
+    effective_fields: frozenset[str] = None,
+) -> dict:
     if not isinstance(data, model):
         data = model.parse_obj(data)
-    return data.dict(**kwargs)
+    if effective_fields is not None:  # one dict-comp vs generic include/exclude
+        result = data.dict(exclude_none=exclude_none, by_alias=True)
+        return {key: value for key, value in result.items() if key in effective_fields}
+    return data.dict(
+        exclude_none=exclude_none, include=include, exclude=exclude, by_alias=by_alias
+    )
 
 
 def kebabify_model(model: type[BaseModel]):